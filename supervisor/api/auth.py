@@ -1,18 +1,22 @@
 """Init file for Supervisor auth/SSO RESTful API."""
 import asyncio
+from base64 import b64decode
+from collections.abc import Mapping
 import logging
+from operator import itemgetter
+from types import MappingProxyType
 from typing import Any
+from urllib.parse import parse_qsl
 
-from aiohttp import BasicAuth, web
+from aiohttp import web
 from aiohttp.hdrs import AUTHORIZATION, CONTENT_TYPE, WWW_AUTHENTICATE
 from aiohttp.web_exceptions import HTTPUnauthorized
+from multidict import MultiDict
 import voluptuous as vol
 
-from ..addons.addon import Addon
 from ..const import ATTR_NAME, ATTR_PASSWORD, ATTR_USERNAME, REQUEST_FROM
 from ..coresys import CoreSysAttributes
 from ..exceptions import APIForbidden
-from ..utils.json import json_loads
 from .const import (
     ATTR_GROUP_IDS,
     ATTR_IS_ACTIVE,
@@ -22,7 +26,7 @@ from .const import (
     CONTENT_TYPE_JSON,
     CONTENT_TYPE_URL,
 )
-from .utils import api_process, api_validate
+from .utils import api_process, api_validate, json_loads
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
@@ -33,33 +37,40 @@ SCHEMA_PASSWORD_RESET = vol.Schema(
     }
 )
 
-REALM_HEADER: dict[str, str] = {
-    WWW_AUTHENTICATE: 'Basic realm="Home Assistant Authentication"'
-}
+USER_FIELDS: tuple[str, ...] = (
+    ATTR_USERNAME,
+    ATTR_NAME,
+    ATTR_IS_OWNER,
+    ATTR_IS_ACTIVE,
+    ATTR_LOCAL_ONLY,
+    ATTR_GROUP_IDS,
+)
+_get_user_fields = itemgetter(*USER_FIELDS)
 
+REALM_HEADER: Mapping[str, str] = MappingProxyType(
+    {WWW_AUTHENTICATE: 'Basic realm="Home Assistant Authentication"'}
+)
 
-class APIAuth(CoreSysAttributes):
-    """Handle RESTful API for auth functions."""
 
-    def _process_basic(self, request: web.Request, addon: Addon) -> bool:
-        """Process login request with basic auth.
+def _parse_basic_auth(header: str) -> tuple[str, str]:
+    """Return username and password of a basic authorization header."""
+    method, _, encoded = header.strip().partition(" ")
+    if method.lower() != "basic":
+        raise HTTPUnauthorized(headers=REALM_HEADER)
 
-        Return a coroutine.
-        """
-        auth = BasicAuth.decode(request.headers[AUTHORIZATION])
-        return self.sys_auth.check_login(addon, auth.login, auth.password)
+    try:
+        decoded = b64decode(encoded, validate=True).decode("latin1")
+    except ValueError:
+        raise HTTPUnauthorized(headers=REALM_HEADER) from None
 
-    def _process_dict(
-        self, request: web.Request, addon: Addon, data: dict[str, str]
-    ) -> bool:
-        """Process login with dict data.
+    username, separator, password = decoded.partition(":")
+    if not separator:
+        raise HTTPUnauthorized(headers=REALM_HEADER)
+    return username, password
 
-        Return a coroutine.
-        """
-        username = data.get("username") or data.get("user")
-        password = data.get("password")
 
-        return self.sys_auth.check_login(addon, username, password)
+class APIAuth(CoreSysAttributes):
+    """Handle RESTful API for auth functions."""
 
     @api_process
     async def auth(self, request: web.Request) -> bool:
@@ -70,22 +81,31 @@ class APIAuth(CoreSysAttributes):
             raise APIForbidden("Can't use Home Assistant auth!")
 
         # BasicAuth
-        if AUTHORIZATION in request.headers:
-            if not await self._process_basic(request, addon):
+        if (authorization := request.headers.get(AUTHORIZATION)) is not None:
+            username, password = _parse_basic_auth(authorization)
+            if not await self.sys_auth.check_login(addon, username, password):
                 raise HTTPUnauthorized(headers=REALM_HEADER)
             return True
 
+        content_type = request.headers.get(CONTENT_TYPE)
+
         # Json
-        if request.headers.get(CONTENT_TYPE) == CONTENT_TYPE_JSON:
-            data = await request.json(loads=json_loads)
-            return await self._process_dict(request, addon, data)
+        if content_type == CONTENT_TYPE_JSON:
+            data = json_loads(await request.read())
 
         # URL encoded
-        if request.headers.get(CONTENT_TYPE) == CONTENT_TYPE_URL:
-            data = await request.post()
-            return await self._process_dict(request, addon, data)
+        elif content_type == CONTENT_TYPE_URL:
+            body = await request.read()
+            data = MultiDict(
+                parse_qsl(body.rstrip().decode("utf-8"), keep_blank_values=True)
+            )
 
-        raise HTTPUnauthorized(headers=REALM_HEADER)
+        else:
+            raise HTTPUnauthorized(headers=REALM_HEADER)
+
+        return await self.sys_auth.check_login(
+            addon, data.get("username") or data.get("user"), data.get("password")
+        )
 
     @api_process
     async def reset(self, request: web.Request) -> None:
@@ -105,14 +125,7 @@ class APIAuth(CoreSysAttributes):
         """List users on the Home Assistant instance."""
         return {
             ATTR_USERS: [
-                {
-                    ATTR_USERNAME: user[ATTR_USERNAME],
-                    ATTR_NAME: user[ATTR_NAME],
-                    ATTR_IS_OWNER: user[ATTR_IS_OWNER],
-                    ATTR_IS_ACTIVE: user[ATTR_IS_ACTIVE],
-                    ATTR_LOCAL_ONLY: user[ATTR_LOCAL_ONLY],
-                    ATTR_GROUP_IDS: user[ATTR_GROUP_IDS],
-                }
+                dict(zip(USER_FIELDS, _get_user_fields(user)))
                 for user in await self.sys_auth.list_users()
                 if user[ATTR_USERNAME]
             ]
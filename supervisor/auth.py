@@ -1,8 +1,11 @@
 """Manage SSO for Add-ons with Home Assistant user."""
+
 import asyncio
 import hashlib
+import hmac
 import logging
-from typing import Any
+from time import monotonic
+from typing import Any, Final
 
 from .addons.addon import Addon
 from .const import ATTR_ADDON, ATTR_PASSWORD, ATTR_TYPE, ATTR_USERNAME, FILE_HASSIO_AUTH
@@ -19,6 +22,9 @@ from .validate import SCHEMA_AUTH_CONFIG
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
+SECONDS_BETWEEN_BACKEND_LOGINS: Final[int] = 60
+SECONDS_BETWEEN_LIST_USERS: Final[int] = 5
+
 
 class Auth(FileConfiguration, CoreSysAttributes):
     """Manage SSO for Add-ons with Home Assistant user."""
@@ -29,6 +35,11 @@ class Auth(FileConfiguration, CoreSysAttributes):
         self.coresys: CoreSys = coresys
 
         self._running: dict[str, asyncio.Task] = {}
+        self._pending: dict[str, asyncio.Task] = {}
+        self._validated: dict[str, float] = {}
+        self._users: list[dict[str, Any]] | None = None
+        self._users_expires: float = 0
+        self._users_lock: asyncio.Lock = asyncio.Lock()
 
     def _check_cache(self, username: str, password: str) -> bool | None:
         """Check password in cache."""
@@ -40,7 +51,7 @@ class Auth(FileConfiguration, CoreSysAttributes):
             return None
 
         # check cache
-        if self._data.get(username_h) == password_h:
+        if self._safe_equal(self._data[username_h], password_h):
             _LOGGER.debug("Username '%s' is in cache", username)
             return True
         return False
@@ -61,6 +72,8 @@ class Auth(FileConfiguration, CoreSysAttributes):
         username_h = self._rehash(username)
         password_h = self._rehash(password, username)
 
+        self._validated.pop(username, None)
+
         if self._data.get(username_h) != password_h:
             return
 
@@ -81,9 +94,21 @@ class Auth(FileConfiguration, CoreSysAttributes):
             _LOGGER.info("Home Assistant not running, checking cache")
             return cache_hit is True
 
-        # No cache hit
+        # No cache hit, share backend request with identical ones in flight
         if cache_hit is None:
-            return await self._backend_login(addon, username, password)
+            key = hashlib.sha256(
+                f"{addon.slug}:{username}\0{password}".encode()
+            ).hexdigest()
+            if key not in self._pending:
+                self._pending[key] = task = self.sys_create_task(
+                    self._backend_login(addon, username, password)
+                )
+                task.add_done_callback(lambda _: self._pending.pop(key, None))
+            return await asyncio.shield(self._pending[key])
+
+        # Skip the backend if it confirmed these credentials recently
+        if cache_hit and monotonic() < self._validated.get(username, 0):
+            return True
 
         # Home Assistant Core take over 1-2sec to validate it
         # Let's use the cache and update the cache in background
@@ -109,6 +134,9 @@ class Auth(FileConfiguration, CoreSysAttributes):
                 if req.status == 200:
                     _LOGGER.info("Successful login for '%s'", username)
                     self._update_cache(username, password)
+                    self._validated[username] = (
+                        monotonic() + SECONDS_BETWEEN_BACKEND_LOGINS
+                    )
                     return True
 
                 _LOGGER.warning("Unauthorized login for '%s'", username)
@@ -121,8 +149,15 @@ class Auth(FileConfiguration, CoreSysAttributes):
 
         raise AuthError()
 
+    def reset_data(self) -> None:
+        """Reset cache and forget recent backend results."""
+        self._validated.clear()
+        self._users = None
+        super().reset_data()
+
     async def change_password(self, username: str, password: str) -> None:
         """Change user password login."""
+        self._validated.pop(username, None)
         try:
             async with self.sys_homeassistant.api.make_request(
                 "post",
@@ -141,15 +176,27 @@ class Auth(FileConfiguration, CoreSysAttributes):
 
     async def list_users(self) -> list[dict[str, Any]]:
         """List users on the Home Assistant instance."""
-        try:
-            return await self.sys_homeassistant.websocket.async_send_command(
-                {ATTR_TYPE: "config/auth/list"}
-            )
-        except HomeAssistantWSError:
-            _LOGGER.error("Can't request listing users on Home Assistant!")
+        async with self._users_lock:
+            if self._users is not None and monotonic() < self._users_expires:
+                return self._users
+
+            try:
+                self._users = await self.sys_homeassistant.websocket.async_send_command(
+                    {ATTR_TYPE: "config/auth/list"}
+                )
+            except HomeAssistantWSError:
+                _LOGGER.error("Can't request listing users on Home Assistant!")
+            else:
+                self._users_expires = monotonic() + SECONDS_BETWEEN_LIST_USERS
+                return self._users
 
         raise AuthListUsersError()
 
+    @staticmethod
+    def _safe_equal(value: str, other: str) -> bool:
+        """Compare two secrets in constant time."""
+        return hmac.compare_digest(value.encode(), other.encode())
+
     @staticmethod
     def _rehash(value: str, salt2: str = "") -> str:
         """Rehash a value."""
@@ -611,13 +611,18 @@ class BackupManager(FileConfiguration, JobGroup):
         """Freeze system to prepare for an external backup such as an image snapshot."""
         self.sys_core.state = CoreState.FREEZE
 
-        # Determine running addons
+        # Determine running addons with a single container listing
         installed = self.sys_addons.installed.copy()
-        is_running: list[bool] = await asyncio.gather(
-            *[addon.is_running() for addon in installed]
+        states = (
+            await self.sys_run_in_executor(
+                self.sys_docker.get_container_states,
+                [addon.instance.name for addon in installed],
+            )
+            if installed
+            else {}
         )
         running_addons = [
-            installed[ind] for ind in range(len(installed)) if is_running[ind]
+            addon for addon in installed if states.get(addon.instance.name) == "running"
         ]
 
         # Create thaw task first to ensure we eventually undo freezes even if the below fails
@@ -1,4 +1,5 @@
 """Audio docker object."""
+from functools import cached_property
 import logging
 
 import docker
@@ -24,6 +25,16 @@ from .interface import DockerInterface
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
 AUDIO_DOCKER_NAME: str = "hassio_audio"
+AUDIO_DOCKER_HOSTNAME: str = AUDIO_DOCKER_NAME.replace("_", "-")
+AUDIO_CAPABILITIES: tuple[Capabilities, ...] = (
+    Capabilities.SYS_NICE,
+    Capabilities.SYS_RESOURCE,
+)
+# Pulseaudio by default tries to use real-time scheduling with priority of 5.
+# Docker SDK requires a list here, it only reads it.
+AUDIO_ULIMITS: list[docker.types.Ulimit] = [
+    docker.types.Ulimit(name="rtprio", soft=10, hard=10)
+]
 
 
 class DockerAudio(DockerInterface, CoreSysAttributes):
@@ -39,7 +50,7 @@ class DockerAudio(DockerInterface, CoreSysAttributes):
         """Return name of Docker container."""
         return AUDIO_DOCKER_NAME
 
-    @property
+    @cached_property
     def mounts(self) -> list[Mount]:
         """Return mounts for container."""
         mounts = [
@@ -68,15 +79,14 @@ class DockerAudio(DockerInterface, CoreSysAttributes):
         ) + self.sys_hardware.policy.get_cgroups_rules(PolicyGroup.BLUETOOTH)
 
     @property
-    def capabilities(self) -> list[Capabilities]:
+    def capabilities(self) -> tuple[Capabilities, ...]:
         """Generate needed capabilities."""
-        return [Capabilities.SYS_NICE, Capabilities.SYS_RESOURCE]
+        return AUDIO_CAPABILITIES
 
     @property
     def ulimits(self) -> list[docker.types.Ulimit]:
         """Generate ulimits for audio."""
-        # Pulseaudio by default tries to use real-time scheduling with priority of 5.
-        return [docker.types.Ulimit(name="rtprio", soft=10, hard=10)]
+        return AUDIO_ULIMITS
 
     @property
     def cpu_rt_runtime(self) -> int | None:
@@ -97,7 +107,7 @@ class DockerAudio(DockerInterface, CoreSysAttributes):
             init=False,
             ipv4=self.sys_docker.network.audio,
             name=self.name,
-            hostname=self.name.replace("_", "-"),
+            hostname=AUDIO_DOCKER_HOSTNAME,
             detach=True,
             cap_add=self.capabilities,
             security_opt=self.security_opt,
@@ -70,11 +70,21 @@ ENV_TOKEN_OLD = "HASSIO_TOKEN"
 
 LABEL_MANAGED = "supervisor_managed"
 
+
+def _read_only_non_recursive_bind_mount(source: str, target: str) -> Mount:
+    """Create a read-only bind mount which keeps submounts writable.
+
+    Docker SDK has no argument for the bind option, set it on the dict directly.
+    """
+    mount = Mount(type=MountType.BIND, source=source, target=target, read_only=True)
+    mount["BindOptions"] = {"ReadOnlyNonRecursive": True}
+    return mount
+
+
 MOUNT_DBUS = Mount(
     type=MountType.BIND, source="/run/dbus", target="/run/dbus", read_only=True
 )
-MOUNT_DEV = Mount(type=MountType.BIND, source="/dev", target="/dev", read_only=True)
-MOUNT_DEV.setdefault("BindOptions", {})["ReadOnlyNonRecursive"] = True
+MOUNT_DEV = _read_only_non_recursive_bind_mount("/dev", "/dev")
 MOUNT_DOCKER = Mount(
     type=MountType.BIND,
     source="/run/docker.sock",
@@ -1,19 +1,19 @@
 """Interface class for Supervisor Docker object."""
 from __future__ import annotations
 
-from collections import defaultdict
+import asyncio
 from collections.abc import Awaitable
 from contextlib import suppress
+from functools import lru_cache
 import logging
-import re
-from time import time
+from string import ascii_lowercase, digits
+from time import time_ns
 from typing import Any
 from uuid import uuid4
 
 from awesomeversion import AwesomeVersion
 from awesomeversion.strategy import AwesomeVersionStrategy
 import docker
-from docker.models.containers import Container
 from docker.models.images import Image
 import requests
 
@@ -49,7 +49,8 @@ from .stats import DockerStats
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
-IMAGE_WITH_HOST = re.compile(r"^((?:[a-z0-9]+(?:-[a-z0-9]+)*\.)+[a-z]{2,})\/.+")
+HOST_LABEL_CHARS = frozenset(ascii_lowercase + digits + "-")
+HOST_TLD_CHARS = frozenset(ascii_lowercase)
 DOCKER_HUB = "hub.docker.com"
 
 MAP_ARCH = {
@@ -61,18 +62,50 @@ MAP_ARCH = {
 }
 
 
-def _container_state_from_model(docker_container: Container) -> ContainerState:
-    """Get container state from model."""
-    if docker_container.status == "running":
-        if "Health" in docker_container.attrs["State"]:
+@lru_cache(maxsize=512)
+def _registry_from_image(image: str) -> str | None:
+    """Return registry host of image if it names one."""
+    host, _, path = image.partition("/")
+    *labels, tld = host.split(".")
+    if (
+        path
+        and labels
+        and len(tld) >= 2
+        and HOST_TLD_CHARS.issuperset(tld)
+        and all(
+            label
+            and label[0] != "-"
+            and label[-1] != "-"
+            and "--" not in label
+            and HOST_LABEL_CHARS.issuperset(label)
+            for label in labels
+        )
+    ):
+        return host
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _version_from_tag(tag: str) -> AwesomeVersion | None:
+    """Return version of image tag or None if it is not a version."""
+    version = AwesomeVersion(tag.partition(":")[2])
+    if version.strategy == AwesomeVersionStrategy.UNKNOWN:
+        return None
+    return version
+
+
+def _container_state_from_model(status: str, state: dict[str, Any]) -> ContainerState:
+    """Get container state from status and State attrs of model."""
+    if status == "running":
+        if (health := state.get("Health")) is not None:
             return (
                 ContainerState.HEALTHY
-                if docker_container.attrs["State"]["Health"]["Status"] == "healthy"
+                if health["Status"] == "healthy"
                 else ContainerState.UNHEALTHY
             )
         return ContainerState.RUNNING
 
-    if docker_container.attrs["State"]["ExitCode"] > 0:
+    if state["ExitCode"] > 0:
         return ContainerState.FAILED
 
     return ContainerState.STOPPED
@@ -83,15 +116,14 @@ class DockerInterface(JobGroup):
 
     def __init__(self, coresys: CoreSys):
         """Initialize Docker base wrapper."""
+        name = self.name
         super().__init__(
-            coresys,
-            JOB_GROUP_DOCKER_INTERFACE.format_map(
-                defaultdict(str, name=self.name or uuid4().hex)
-            ),
-            self.name,
+            coresys, JOB_GROUP_DOCKER_INTERFACE.format(name=name or uuid4().hex), name
         )
         self.coresys: CoreSys = coresys
-        self._meta: dict[str, Any] | None = None
+        self._meta_data: dict[str, Any] | None = None
+        self._meta_config: dict[str, Any] = {}
+        self._meta_labels: dict[str, str] = {}
 
     @property
     def timeout(self) -> int:
@@ -103,12 +135,22 @@ class DockerInterface(JobGroup):
         """Return name of Docker container."""
         return None
 
+    @property
+    def _meta(self) -> dict[str, Any] | None:
+        """Return meta data of container/image."""
+        return self._meta_data
+
+    @_meta.setter
+    def _meta(self, value: dict[str, Any] | None) -> None:
+        """Set meta data of container/image."""
+        self._meta_data = value
+        self._meta_config = value.get("Config", {}) if value else {}
+        self._meta_labels = self._meta_config.get("Labels") or {}
+
     @property
     def meta_config(self) -> dict[str, Any]:
         """Return meta data of configuration for container/image."""
-        if not self._meta:
-            return {}
-        return self._meta.get("Config", {})
+        return self._meta_config
 
     @property
     def meta_host(self) -> dict[str, Any]:
@@ -120,7 +162,7 @@ class DockerInterface(JobGroup):
     @property
     def meta_labels(self) -> dict[str, str]:
         """Return meta data of labels for container/image."""
-        return self.meta_config.get("Labels") or {}
+        return self._meta_labels
 
     @property
     def meta_mounts(self) -> list[dict[str, Any]]:
@@ -133,21 +175,21 @@ class DockerInterface(JobGroup):
     def image(self) -> str | None:
         """Return name of Docker image."""
         try:
-            return self.meta_config["Image"].partition(":")[0]
+            return self._meta_config["Image"].partition(":")[0]
         except KeyError:
             return None
 
     @property
     def version(self) -> AwesomeVersion | None:
         """Return version of Docker image."""
-        if LABEL_VERSION not in self.meta_labels:
+        if (version := self._meta_labels.get(LABEL_VERSION)) is None:
             return None
-        return AwesomeVersion(self.meta_labels[LABEL_VERSION])
+        return AwesomeVersion(version)
 
     @property
     def arch(self) -> str | None:
         """Return arch of Docker image."""
-        return self.meta_labels.get(LABEL_ARCH)
+        return self._meta_labels.get(LABEL_ARCH)
 
     @property
     def in_progress(self) -> bool:
@@ -179,12 +221,12 @@ class DockerInterface(JobGroup):
         """Return a dictionay with credentials for docker login."""
         registry = None
         credentials = {}
-        matcher = IMAGE_WITH_HOST.match(image)
+        image_registry = _registry_from_image(image)
 
         # Custom registry
-        if matcher:
-            if matcher.group(1) in self.sys_docker.config.registries:
-                registry = matcher.group(1)
+        if image_registry:
+            if image_registry in self.sys_docker.config.registries:
+                registry = image_registry
                 credentials[ATTR_REGISTRY] = registry
 
         # If no match assume "dockerhub" as registry
@@ -215,6 +257,19 @@ class DockerInterface(JobGroup):
 
         await self.sys_run_in_executor(self.sys_docker.docker.login, **credentials)
 
+    async def _pull_image(
+        self, image: str, version: AwesomeVersion, platform: str
+    ) -> Image:
+        """Pull image or join a pull of the same image already in progress."""
+        key = f"{image}:{version!s}@{platform}"
+        if not (pull := self.sys_docker.pulls.get(key)):
+            self.sys_docker.pulls[key] = pull = self.sys_run_in_executor(
+                self.sys_docker.images.pull, f"{image}:{version!s}", platform=platform
+            )
+            pull.add_done_callback(lambda _: self.sys_docker.pulls.pop(key, None))
+
+        return await asyncio.shield(pull)
+
     @Job(
         name="docker_interface_install",
         limit=JobExecutionLimit.GROUP_ONCE,
@@ -238,11 +293,7 @@ class DockerInterface(JobGroup):
                 await self._docker_login(image)
 
             # Pull new image
-            docker_image = await self.sys_run_in_executor(
-                self.sys_docker.images.pull,
-                f"{image}:{version!s}",
-                platform=MAP_ARCH[arch],
-            )
+            docker_image = await self._pull_image(image, version, MAP_ARCH[arch])
 
             # Validate content
             try:
@@ -331,7 +382,9 @@ class DockerInterface(JobGroup):
         except requests.RequestException as err:
             raise DockerRequestError() from err
 
-        return _container_state_from_model(docker_container)
+        return _container_state_from_model(
+            docker_container.status, docker_container.attrs["State"]
+        )
 
     @Job(name="docker_interface_attach", limit=JobExecutionLimit.GROUP_WAIT)
     async def attach(
@@ -342,10 +395,10 @@ class DockerInterface(JobGroup):
             docker_container = await self.sys_run_in_executor(
                 self.sys_docker.containers.get, self.name
             )
-            self._meta = docker_container.attrs
+            self._meta = attrs = docker_container.attrs
             self.sys_docker.monitor.watch_container(docker_container)
 
-            state = _container_state_from_model(docker_container)
+            state = _container_state_from_model(docker_container.status, attrs["State"])
             if not (
                 skip_state_event_if_down
                 and state in [ContainerState.STOPPED, ContainerState.FAILED]
@@ -354,7 +407,10 @@ class DockerInterface(JobGroup):
                 self.sys_bus.fire_event(
                     BusEvent.DOCKER_CONTAINER_STATE_CHANGE,
                     DockerContainerStateEvent(
-                        self.name, state, docker_container.id, int(time())
+                        self.name,
+                        state,
+                        docker_container.id,
+                        time_ns() // 1_000_000_000,
                     ),
                 )
 
@@ -454,19 +510,27 @@ class DockerInterface(JobGroup):
         expected_arch = expected_arch or self.sys_arch.supervisor
         image_name = f"{expected_image}:{version!s}"
         if self.image == expected_image:
-            try:
-                image: Image = await self.sys_run_in_executor(
-                    self.sys_docker.images.get, image_name
-                )
-            except (docker.errors.DockerException, requests.RequestException) as err:
-                raise DockerError(
-                    f"Could not get {image_name} for check due to: {err!s}",
-                    _LOGGER.error,
-                ) from err
-
-            image_arch = f"{image.attrs['Os']}/{image.attrs['Architecture']}"
-            if "Variant" in image.attrs:
-                image_arch = f"{image_arch}/{image.attrs['Variant']}"
+            # Meta data is already from this image if we attached without a container
+            if self._meta and image_name in self._meta.get("RepoTags", []):
+                image_attrs = self._meta
+            else:
+                try:
+                    image: Image = await self.sys_run_in_executor(
+                        self.sys_docker.images.get, image_name
+                    )
+                except (
+                    docker.errors.DockerException,
+                    requests.RequestException,
+                ) as err:
+                    raise DockerError(
+                        f"Could not get {image_name} for check due to: {err!s}",
+                        _LOGGER.error,
+                    ) from err
+                image_attrs = image.attrs
+
+            image_arch = f"{image_attrs['Os']}/{image_attrs['Architecture']}"
+            if "Variant" in image_attrs:
+                image_arch = f"{image_arch}/{image_attrs['Variant']}"
 
             # If we have an image and its the right arch, all set
             if MAP_ARCH[expected_arch] == image_arch:
@@ -570,16 +634,18 @@ class DockerInterface(JobGroup):
 
     async def get_latest_version(self) -> AwesomeVersion:
         """Return latest version of local image."""
-        available_version: list[AwesomeVersion] = []
         try:
-            for image in await self.sys_run_in_executor(
-                self.sys_docker.images.list, self.image
-            ):
-                for tag in image.tags:
-                    version = AwesomeVersion(tag.partition(":")[2])
-                    if version.strategy == AwesomeVersionStrategy.UNKNOWN:
-                        continue
-                    available_version.append(version)
+            images = await self.sys_run_in_executor(
+                self.sys_docker.images.list,
+                name=self.image,
+                filters={"dangling": False},
+            )
+            available_version: list[AwesomeVersion] = [
+                version
+                for image in images
+                for tag in image.tags
+                if (version := _version_from_tag(tag)) is not None
+            ]
 
             if not available_version:
                 raise ValueError()
@@ -595,9 +661,7 @@ class DockerInterface(JobGroup):
 
         _LOGGER.info("Found %s versions: %s", self.image, available_version)
 
-        # Sort version and return latest version
-        available_version.sort(reverse=True)
-        return available_version[0]
+        return max(available_version)
 
     @Job(
         name="docker_interface_run_inside",
@@ -1,6 +1,8 @@
 """Manager for Supervisor Docker."""
+import asyncio
 from contextlib import suppress
 from ipaddress import IPv4Address
+from json import JSONDecodeError
 import logging
 import os
 from pathlib import Path
@@ -29,6 +31,7 @@ from ..const import (
 from ..coresys import CoreSys
 from ..exceptions import DockerAPIError, DockerError, DockerNotFound, DockerRequestError
 from ..utils.common import FileConfiguration
+from ..utils.json import json_loads
 from ..validate import SCHEMA_DOCKER_CONFIG
 from .const import LABEL_MANAGED
 from .monitor import DockerMonitor
@@ -40,7 +43,25 @@ MIN_SUPPORTED_DOCKER: Final = AwesomeVersion("20.10.1")
 DOCKER_NETWORK_HOST: Final = "host"
 
 
-@attr.s(frozen=True)
+class _OrjsonResponse(requests.Response):
+    """Docker API response decoding JSON with orjson."""
+
+    def json(self, **kwargs: Any) -> Any:
+        """Return decoded JSON content of response."""
+        try:
+            return json_loads(self.content)
+        except JSONDecodeError as err:
+            raise requests.exceptions.JSONDecodeError(
+                err.msg, err.doc, err.pos
+            ) from err
+
+
+def _orjson_response_hook(response: requests.Response, **kwargs: Any) -> None:
+    """Decode JSON of Docker API responses with orjson."""
+    response.__class__ = _OrjsonResponse
+
+
+@attr.s(frozen=True, slots=True)
 class CommandReturn:
     """Return object from command run."""
 
@@ -107,10 +128,12 @@ class DockerAPI:
         self.docker: DockerClient = DockerClient(
             base_url=f"unix:/{str(SOCKET_DOCKER)}", version="auto", timeout=900
         )
+        self.docker.api.hooks["response"].append(_orjson_response_hook)
         self.network: DockerNetwork = DockerNetwork(self.docker)
         self._info: DockerInfo = DockerInfo.new(self.docker.info())
         self.config: DockerConfig = DockerConfig()
         self._monitor: DockerMonitor = DockerMonitor(coresys)
+        self.pulls: dict[str, asyncio.Future[Image]] = {}
 
     @property
     def images(self) -> ImageCollection:
@@ -376,6 +399,27 @@ class DockerAPI:
             and docker_container.status in ("exited", "running", "created")
         )
 
+    def get_container_states(self, names: list[str]) -> dict[str, str]:
+        """Return state of existing containers by name from a single request.
+
+        Need run inside executor.
+        """
+        try:
+            containers: list[Container] = self.containers.list(
+                all=True, sparse=True, filters={"name": names}
+            )
+        except (DockerException, requests.RequestException) as err:
+            raise DockerError(f"Can't list containers: {err}", _LOGGER.error) from err
+
+        # Name filter of Docker matches substrings
+        wanted = set(names)
+        return {
+            name: container.attrs["State"]
+            for container in containers
+            for name in (name.lstrip("/") for name in container.attrs["Names"])
+            if name in wanted
+        }
+
     def stop_container(
         self, name: str, timeout: int, remove_container: bool = True
     ) -> None:
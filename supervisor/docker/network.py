@@ -1,7 +1,10 @@
 """Internal network manager for Supervisor."""
 from contextlib import suppress
+from functools import cached_property
 from ipaddress import IPv4Address
 import logging
+from time import monotonic
+from typing import Final
 
 import docker
 import requests
@@ -11,6 +14,8 @@ from ..exceptions import DockerError
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
+NETWORK_ATTRS_MAX_AGE: Final[float] = 5.0
+
 
 class DockerNetwork:
     """Internal Supervisor Network.
@@ -22,6 +27,10 @@ class DockerNetwork:
         """Initialize internal Supervisor network."""
         self.docker: docker.DockerClient = docker_client
         self._network: docker.models.networks.Network = self._get_network()
+        self._attrs_updated: float = float("-inf")
+        self._container_ids: dict[str, str] = {}
+        self._container_id_set: frozenset[str] = frozenset()
+        self._index_containers()
 
     @property
     def name(self) -> str:
@@ -39,35 +48,70 @@ class DockerNetwork:
         return list(self.network.attrs.get("Containers", {}).keys())
 
     @property
+    def container_ids(self) -> frozenset[str]:
+        """Return ids of connected containers as of last network reload."""
+        return self._container_id_set
+
+    @cached_property
     def gateway(self) -> IPv4Address:
         """Return gateway of the network."""
         return DOCKER_NETWORK_MASK[1]
 
-    @property
+    @cached_property
     def supervisor(self) -> IPv4Address:
         """Return supervisor of the network."""
         return DOCKER_NETWORK_MASK[2]
 
-    @property
+    @cached_property
     def dns(self) -> IPv4Address:
         """Return dns of the network."""
         return DOCKER_NETWORK_MASK[3]
 
-    @property
+    @cached_property
     def audio(self) -> IPv4Address:
         """Return audio of the network."""
         return DOCKER_NETWORK_MASK[4]
 
-    @property
+    @cached_property
     def cli(self) -> IPv4Address:
         """Return cli of the network."""
         return DOCKER_NETWORK_MASK[5]
 
-    @property
+    @cached_property
     def observer(self) -> IPv4Address:
         """Return observer of the network."""
         return DOCKER_NETWORK_MASK[6]
 
+    @cached_property
+    def _default_bridge(self) -> docker.models.networks.Network:
+        """Return default Docker bridge network.
+
+        Need run inside executor.
+        """
+        return self.docker.networks.get("bridge")
+
+    def _refresh_attrs(self, max_age: float = NETWORK_ATTRS_MAX_AGE) -> None:
+        """Reload network information if it is older than max_age seconds.
+
+        Need run inside executor.
+        """
+        if monotonic() - self._attrs_updated < max_age:
+            return
+
+        with suppress(docker.errors.DockerException, requests.RequestException):
+            self.network.attrs = self.docker.api.inspect_network(self.network.id)
+            self._attrs_updated = monotonic()
+
+        self._index_containers()
+
+    def _index_containers(self) -> None:
+        """Index connected containers from network information."""
+        self._container_ids = {
+            val.get("Name"): container_id
+            for container_id, val in self.network.attrs.get("Containers", {}).items()
+        }
+        self._container_id_set = frozenset(self._container_ids.values())
+
     def _get_network(self) -> docker.models.networks.Network:
         """Get supervisor network."""
         try:
@@ -103,23 +147,31 @@ class DockerNetwork:
         """
         ipv4_address = str(ipv4) if ipv4 else None
 
-        # Reload Network information
-        with suppress(docker.errors.DockerException, requests.RequestException):
-            self.network.reload()
-
         # Check stale Network
-        if container.name in (
-            val.get("Name") for val in self.network.attrs.get("Containers", {}).values()
-        ):
+        self._refresh_attrs()
+        if container.name in self._container_ids:
             self.stale_cleanup(container.name)
 
         # Attach Network
         try:
             self.network.connect(container, aliases=alias, ipv4_address=ipv4_address)
         except docker.errors.APIError as err:
-            raise DockerError(
-                f"Can't link container to hassio-net: {err}", _LOGGER.error
-            ) from err
+            # Cached information might miss a stale endpoint, reload and retry once
+            self._refresh_attrs(max_age=0)
+            if container.name not in self._container_ids:
+                raise DockerError(
+                    f"Can't link container to hassio-net: {err}", _LOGGER.error
+                ) from err
+
+            self.stale_cleanup(container.name)
+            try:
+                self.network.connect(
+                    container, aliases=alias, ipv4_address=ipv4_address
+                )
+            except docker.errors.APIError as retry_err:
+                raise DockerError(
+                    f"Can't link container to hassio-net: {retry_err}", _LOGGER.error
+                ) from retry_err
 
     def detach_default_bridge(
         self, container: docker.models.containers.Container
@@ -129,8 +181,13 @@ class DockerNetwork:
         Need run inside executor.
         """
         try:
-            default_network = self.docker.networks.get("bridge")
-            default_network.disconnect(container)
+            try:
+                self._default_bridge.disconnect(container)
+            except docker.errors.NotFound:
+                # Cached bridge can be gone after Docker recreated it
+                with suppress(AttributeError):
+                    del self._default_bridge
+                self._default_bridge.disconnect(container)
 
         except docker.errors.NotFound:
             return
@@ -145,6 +202,7 @@ class DockerNetwork:
 
         Fix: https://github.com/moby/moby/issues/23302
         """
+        self._attrs_updated = float("-inf")
         try:
             self.network.disconnect(container_name, force=True)
         except docker.errors.NotFound:
@@ -3,11 +3,14 @@ from collections.abc import Awaitable
 from ipaddress import IPv4Address
 import logging
 import os
+from typing import Any
 
 from awesomeversion.awesomeversion import AwesomeVersion
 import docker
+from docker.models.images import Image
 import requests
 
+from ..coresys import CoreSys
 from ..exceptions import DockerError
 from ..jobs.const import JobExecutionLimit
 from ..jobs.decorator import Job
@@ -20,6 +23,13 @@ _LOGGER: logging.Logger = logging.getLogger(__name__)
 class DockerSupervisor(DockerInterface):
     """Docker Supervisor wrapper for Supervisor."""
 
+    def __init__(self, coresys: CoreSys):
+        """Initialize Docker Supervisor wrapper."""
+        super().__init__(coresys)
+        self._image_id: str | None = None
+        self._host_mounts_meta: dict[str, Any] | None = None
+        self._host_mounts_available: bool = False
+
     @property
     def name(self) -> str:
         """Return name of Docker container."""
@@ -38,11 +48,15 @@ class DockerSupervisor(DockerInterface):
     @property
     def host_mounts_available(self) -> bool:
         """Return True if container can see mounts on host within its data directory."""
-        return self._meta and any(
-            mount.get("Propagation") == PropagationMode.SLAVE
-            for mount in self.meta_mounts
-            if mount.get("Destination") == "/data"
-        )
+        # Meta data is only ever replaced as a whole, never changed in place
+        if self._host_mounts_meta is not self._meta:
+            self._host_mounts_meta = self._meta
+            self._host_mounts_available = bool(self._meta) and any(
+                mount.get("Propagation") == PropagationMode.SLAVE
+                for mount in self.meta_mounts
+                if mount.get("Destination") == "/data"
+            )
+        return self._host_mounts_available
 
     @Job(name="docker_supervisor_attach", limit=JobExecutionLimit.GROUP_WAIT)
     async def attach(
@@ -57,6 +71,7 @@ class DockerSupervisor(DockerInterface):
             raise DockerError() from err
 
         self._meta = docker_container.attrs
+        self._image_id = docker_container.attrs.get("Image")
         _LOGGER.info(
             "Attaching to Supervisor %s with version %s",
             self.image,
@@ -64,7 +79,7 @@ class DockerSupervisor(DockerInterface):
         )
 
         # If already attach
-        if docker_container.id in self.sys_docker.network.containers:
+        if docker_container.id in self.sys_docker.network.container_ids:
             return
 
         # Attach to network
@@ -81,17 +96,27 @@ class DockerSupervisor(DockerInterface):
         """Retag latest image to version."""
         return self.sys_run_in_executor(self._retag)
 
+    def _get_running_image(self) -> Image:
+        """Return image of running Supervisor container.
+
+        Need run inside executor.
+        """
+        if self._image_id:
+            return self.sys_docker.images.get(self._image_id)
+        return self.sys_docker.containers.get(self.name).image
+
     def _retag(self) -> None:
         """Retag latest image to version.
 
         Need run inside executor.
         """
         try:
-            docker_container = self.sys_docker.containers.get(self.name)
+            running_image = self._get_running_image()
 
-            docker_container.image.tag(self.image, tag=str(self.version))
-            docker_container.image.tag(self.image, tag="latest")
+            running_image.tag(self.image, tag=str(self.version))
+            running_image.tag(self.image, tag="latest")
         except (docker.errors.DockerException, requests.RequestException) as err:
+            self._image_id = None
             raise DockerError(
                 f"Can't retag Supervisor version: {err}", _LOGGER.error
             ) from err
@@ -107,19 +132,19 @@ class DockerSupervisor(DockerInterface):
         Need run inside executor.
         """
         try:
-            docker_container = self.sys_docker.containers.get(self.name)
+            running_image = self._get_running_image()
             docker_image = self.sys_docker.images.get(f"{image}:{version!s}")
 
             # Find start tag
-            for tag in docker_container.image.tags:
-                start_image = tag.partition(":")[0]
-                start_tag = tag.partition(":")[2] or "latest"
+            for tag in running_image.tags:
+                start_image, _, start_tag = tag.partition(":")
 
                 # If version tag
-                if start_tag != "latest":
+                if start_tag not in ("", "latest"):
                     continue
-                docker_image.tag(start_image, start_tag)
+                docker_image.tag(start_image, "latest")
                 docker_image.tag(start_image, version.string)
 
         except (docker.errors.DockerException, requests.RequestException) as err:
+            self._image_id = None
             raise DockerError(f"Can't fix start tag: {err}", _LOGGER.error) from err
@@ -1,13 +1,17 @@
 """Test auth API."""
 
 from datetime import UTC, datetime, timedelta
-from unittest.mock import AsyncMock, patch
+from unittest.mock import ANY, AsyncMock, PropertyMock, patch
 
+from aiohttp import BasicAuth
 from aiohttp.test_utils import TestClient
 import pytest
 
+from supervisor.addons.addon import Addon
 from supervisor.coresys import CoreSys
 
+from tests.const import TEST_ADDON_SLUG
+
 LIST_USERS_RESPONSE = [
     {
         "id": "a1d90e114a3b4da4a487fe327918dcef",
@@ -106,3 +110,99 @@ async def test_list_users(
             "group_ids": ["system-admin"],
         },
     ]
+
+
+@pytest.fixture(name="mock_check_login")
+def fixture_mock_check_login(coresys: CoreSys):
+    """Patch sys_auth.check_login."""
+    with patch.object(Addon, "access_auth_api", new=PropertyMock(return_value=True)):
+        coresys.auth.check_login = AsyncMock(return_value=True)
+        yield coresys.auth.check_login
+
+
+@pytest.mark.parametrize("api_client", [TEST_ADDON_SLUG], indirect=True)
+async def test_auth_json_success(
+    api_client: TestClient, mock_check_login: AsyncMock, install_addon_ssh: Addon
+):
+    """Test successful JSON auth."""
+    resp = await api_client.post("/auth", json={"username": "test", "password": "pass"})
+    assert resp.status == 200
+    mock_check_login.assert_called_once_with(ANY, "test", "pass")
+
+
+@pytest.mark.parametrize("api_client", [TEST_ADDON_SLUG], indirect=True)
+async def test_auth_urlencoded_success(
+    api_client: TestClient, mock_check_login: AsyncMock, install_addon_ssh: Addon
+):
+    """Test successful URL encoded auth."""
+    resp = await api_client.post(
+        "/auth",
+        data="user=test&password=pass%3A%C3%A4",
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    assert resp.status == 200
+    mock_check_login.assert_called_once_with(ANY, "test", "pass:ä")
+
+
+@pytest.mark.parametrize("api_client", [TEST_ADDON_SLUG], indirect=True)
+async def test_auth_urlencoded_form_semantics(
+    api_client: TestClient, mock_check_login: AsyncMock, install_addon_ssh: Addon
+):
+    """Test URL encoded auth strips trailing whitespace and keeps first value."""
+    resp = await api_client.post(
+        "/auth",
+        data="username=test&password=pass&password=other\n",
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    assert resp.status == 200
+    mock_check_login.assert_called_once_with(ANY, "test", "pass")
+
+    mock_check_login.reset_mock()
+    resp = await api_client.post(
+        "/auth",
+        data="username=test&password=pass\n",
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    assert resp.status == 200
+    mock_check_login.assert_called_once_with(ANY, "test", "pass")
+
+
+@pytest.mark.parametrize("api_client", [TEST_ADDON_SLUG], indirect=True)
+async def test_auth_basic_auth(
+    api_client: TestClient, mock_check_login: AsyncMock, install_addon_ssh: Addon
+):
+    """Test basic auth success and failure."""
+    resp = await api_client.post("/auth", auth=BasicAuth("test", "pass:word"))
+    assert resp.status == 200
+    mock_check_login.assert_called_once_with(ANY, "test", "pass:word")
+
+    mock_check_login.return_value = False
+    resp = await api_client.post("/auth", auth=BasicAuth("test", "wrong"))
+    assert resp.status == 401
+    assert "WWW-Authenticate" in resp.headers
+
+
+@pytest.mark.parametrize(
+    "header", ["Bearer abc", "Basic not-base64!", "Basic dGVzdA==", "Basic é"]
+)
+@pytest.mark.parametrize("api_client", [TEST_ADDON_SLUG], indirect=True)
+async def test_auth_basic_auth_malformed(
+    api_client: TestClient,
+    mock_check_login: AsyncMock,
+    install_addon_ssh: Addon,
+    header: str,
+):
+    """Test malformed basic auth header is unauthorized."""
+    resp = await api_client.post("/auth", headers={"Authorization": header})
+    assert resp.status == 401
+    mock_check_login.assert_not_called()
+
+
+@pytest.mark.parametrize("api_client", [TEST_ADDON_SLUG], indirect=True)
+async def test_auth_no_credentials(
+    api_client: TestClient, mock_check_login: AsyncMock, install_addon_ssh: Addon
+):
+    """Test auth without any credentials."""
+    resp = await api_client.post("/auth")
+    assert resp.status == 401
+    mock_check_login.assert_not_called()
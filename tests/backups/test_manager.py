@@ -1332,6 +1332,9 @@ async def test_freeze_thaw(
 ):
     """Test manual freeze and thaw for external snapshots."""
     container.status = "running"
+    coresys.docker.containers.list.return_value = [
+        MagicMock(attrs={"Names": [f"/addon_{TEST_ADDON_SLUG}"], "State": "running"})
+    ]
     install_addon_ssh.path_data.mkdir()
     coresys.core.state = CoreState.RUNNING
     coresys.hardware.disk.get_disk_free_space = lambda x: 5000
@@ -1404,6 +1407,38 @@ async def test_freeze_thaw(
         ]
 
 
+async def test_freeze_running_addons_single_request(
+    coresys: CoreSys,
+    install_addon_ssh: Addon,
+    container: MagicMock,
+    ha_ws_client: AsyncMock,
+    tmp_supervisor_data,
+    path_extern,
+):
+    """Test freeze finds running add-ons from one sparse container listing."""
+    coresys.docker.containers.list.return_value = [
+        MagicMock(attrs={"Names": [f"/addon_{TEST_ADDON_SLUG}"], "State": "running"}),
+        MagicMock(attrs={"Names": [f"/addon_{TEST_ADDON_SLUG}_2"], "State": "exited"}),
+    ]
+    coresys.core.state = CoreState.RUNNING
+    coresys.hardware.disk.get_disk_free_space = lambda x: 5000
+    ha_ws_client.ha_version = AwesomeVersion("2022.1.0")
+
+    with patch.object(Addon, "begin_backup") as begin_backup, patch.object(
+        Addon, "end_backup"
+    ):
+        await coresys.backups.freeze_all(timeout=0.01)
+        begin_backup.assert_called_once()
+
+        coresys.docker.containers.list.assert_called_once_with(
+            all=True, sparse=True, filters={"name": [f"addon_{TEST_ADDON_SLUG}"]}
+        )
+        coresys.docker.containers.get.assert_not_called()
+
+        await asyncio.sleep(0.02)
+        assert coresys.core.state == CoreState.RUNNING
+
+
 async def test_freeze_thaw_timeout(
     coresys: CoreSys,
     ha_ws_client: AsyncMock,
@@ -24,7 +24,7 @@ async def test_start(coresys: CoreSys, tmp_supervisor_data: Path, path_extern):
         assert run.call_args.kwargs["ipv4"] == IPv4Address("172.30.32.4")
         assert run.call_args.kwargs["name"] == "hassio_audio"
         assert run.call_args.kwargs["hostname"] == "hassio-audio"
-        assert run.call_args.kwargs["cap_add"] == ["SYS_NICE", "SYS_RESOURCE"]
+        assert run.call_args.kwargs["cap_add"] == ("SYS_NICE", "SYS_RESOURCE")
         assert run.call_args.kwargs["ulimits"] == [
             {"Name": "rtprio", "Soft": 10, "Hard": 10}
         ]
@@ -1,7 +1,33 @@
 """Test docker login."""
 # pylint: disable=protected-access
+import pytest
+
 from supervisor.coresys import CoreSys
-from supervisor.docker.interface import DOCKER_HUB, DockerInterface
+from supervisor.docker.interface import (
+    DOCKER_HUB,
+    DockerInterface,
+    _registry_from_image,
+)
+
+
+@pytest.mark.parametrize(
+    "image,registry",
+    [
+        ("ghcr.io/home-assistant/amd64-hassio-supervisor", "ghcr.io"),
+        ("my-registry.example.com/addon", "my-registry.example.com"),
+        ("homeassistant/amd64-supervisor", None),
+        ("localhost:5000/addon", None),
+        ("ghcr.io/", None),
+        ("ghcr.io", None),
+        ("GHCR.io/addon", None),
+        ("-ghcr.io/addon", None),
+        ("my--registry.io/addon", None),
+        ("registry.i0/addon", None),
+    ],
+)
+def test_registry_from_image(image: str, registry: str | None):
+    """Test registry host extraction from image name."""
+    assert _registry_from_image(image) == registry
 
 
 def test_no_credentials(coresys: CoreSys):
@@ -1,5 +1,7 @@
 """Test Docker interface."""
+# pylint: disable=protected-access
 import asyncio
+import time
 from typing import Any
 from unittest.mock import MagicMock, Mock, PropertyMock, call, patch
 
@@ -67,6 +69,26 @@ async def test_docker_image_default_platform(coresys: CoreSys):
         assert pull.call_args == call("test:1.2.3", platform="linux/386")
 
 
+async def test_docker_image_concurrent_pull(coresys: CoreSys):
+    """Test concurrent installs of the same image share one pull."""
+
+    def slow_pull(*args, **kwargs):
+        time.sleep(0.1)
+        return Mock(id="test:1.2.3")
+
+    with patch.object(coresys.docker.images, "pull", side_effect=slow_pull) as pull:
+        await asyncio.gather(
+            DockerInterface(coresys).install(
+                AwesomeVersion("1.2.3"), "test", arch=CpuArch.AMD64
+            ),
+            DockerInterface(coresys).install(
+                AwesomeVersion("1.2.3"), "test", arch=CpuArch.AMD64
+            ),
+        )
+        pull.assert_called_once_with("test:1.2.3", platform="linux/amd64")
+        assert not coresys.docker.pulls
+
+
 @pytest.mark.parametrize(
     "attrs,expected",
     [
@@ -155,7 +177,7 @@ async def test_attach_existing_container(
         "supervisor.docker.manager.DockerAPI.containers",
         new=PropertyMock(return_value=container_collection),
     ), patch.object(type(coresys.bus), "fire_event") as fire_event, patch(
-        "supervisor.docker.interface.time", return_value=1
+        "supervisor.docker.interface.time_ns", return_value=1_000_000_000
     ):
         await coresys.homeassistant.core.instance.attach(AwesomeVersion("2022.7.3"))
         await asyncio.sleep(0)
@@ -260,3 +282,43 @@ async def test_run_missing_image(
         await install_addon_ssh.instance.run()
 
     capture_exception.assert_called_once()
+
+
+async def test_check_image_uses_image_meta(coresys: CoreSys):
+    """Test check image reuses meta data from the same image."""
+    instance = DockerInterface(coresys)
+    instance._meta = {
+        "Config": {"Image": "test:1.2.3"},
+        "RepoTags": ["test:1.2.3"],
+        "Os": "linux",
+        "Architecture": "amd64",
+    }
+
+    with patch.object(DockerInterface, "install") as install:
+        await instance.check_image(AwesomeVersion("1.2.3"), "test", CpuArch.AMD64)
+
+    coresys.docker.images.get.assert_not_called()
+    install.assert_not_called()
+
+
+async def test_get_latest_version(coresys: CoreSys):
+    """Test latest version skips tags that are not versions."""
+    instance = DockerInterface(coresys)
+    instance._meta = {"Config": {"Image": "test:1.2.3"}}
+    coresys.docker.images.list.return_value = [
+        MagicMock(tags=["test:landingpage", "test:1.2.3"]),
+        MagicMock(tags=["test:2023.9.0"]),
+        MagicMock(tags=["test:2023.10.0b1"]),
+    ]
+
+    assert await instance.get_latest_version() == AwesomeVersion("2023.10.0b1")
+    coresys.docker.images.list.assert_called_once_with(
+        name="test", filters={"dangling": False}
+    )
+
+    coresys.docker.images.list.return_value.append(MagicMock(tags=["test:latest"]))
+    assert await instance.get_latest_version() == AwesomeVersion("latest")
+
+    coresys.docker.images.list.return_value = [MagicMock(tags=["test:landingpage"])]
+    with pytest.raises(DockerNotFound):
+        await instance.get_latest_version()
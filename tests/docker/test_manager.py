@@ -0,0 +1,62 @@
+"""Test Docker manager."""
+# pylint: disable=protected-access
+import gc
+import weakref
+
+from docker.errors import APIError, create_api_error_from_http_exception
+import pytest
+import requests
+
+from supervisor.docker.manager import _orjson_response_hook
+
+
+def _response(content: bytes) -> requests.Response:
+    """Return a response with content."""
+    response = requests.Response()
+    response._content = content
+    response.status_code = 200
+    return response
+
+
+def test_orjson_response_hook():
+    """Test response hook decodes JSON with orjson."""
+    response = _response(b'{"Id": "abc123", "State": {"Status": "running"}}')
+    _orjson_response_hook(response)
+
+    assert response.json() == {"Id": "abc123", "State": {"Status": "running"}}
+
+
+def test_orjson_response_hook_invalid():
+    """Test response hook raises the requests decode error for bodies that are not JSON."""
+    response = _response(b"page not found")
+    _orjson_response_hook(response)
+
+    with pytest.raises(requests.exceptions.JSONDecodeError) as err:
+        response.json()
+
+    assert isinstance(err.value, requests.RequestException)
+    assert isinstance(err.value, ValueError)
+
+
+def test_orjson_response_hook_no_reference_cycle():
+    """Test hooked response is freed without the cyclic garbage collector."""
+    response = _response(b"{}")
+    _orjson_response_hook(response)
+    ref = weakref.ref(response)
+
+    gc.disable()
+    try:
+        del response
+        assert ref() is None
+    finally:
+        gc.enable()
+
+
+def test_orjson_response_hook_api_error():
+    """Test docker-py still builds API errors from responses that are not JSON."""
+    response = _response(b"page not found")
+    response.status_code = 404
+    _orjson_response_hook(response)
+
+    with pytest.raises(APIError, match="page not found"):
+        create_api_error_from_http_exception(requests.HTTPError(response=response))
@@ -0,0 +1,99 @@
+"""Test Internal network manager for Supervisor."""
+from unittest.mock import MagicMock
+
+from docker.errors import APIError, NotFound
+
+from supervisor.docker.network import DockerNetwork
+
+
+def test_attach_container_reload_cached():
+    """Test network information is reused for attaches in quick succession."""
+    docker_client = MagicMock()
+    docker_client.api.inspect_network.return_value = {"Containers": {}}
+    network = DockerNetwork(docker_client)
+
+    network.attach_container(MagicMock())
+    network.attach_container(MagicMock())
+
+    docker_client.api.inspect_network.assert_called_once_with(network.network.id)
+    assert network.network.connect.call_count == 2
+    network.network.disconnect.assert_not_called()
+
+
+def test_attach_container_stale_retry():
+    """Test connect failure reloads network information and cleans stale endpoint."""
+    docker_client = MagicMock()
+    docker_client.api.inspect_network.return_value = {"Containers": {}}
+    network = DockerNetwork(docker_client)
+    network.attach_container(MagicMock())
+
+    container = MagicMock()
+    container.name = "addon_1"
+    docker_client.api.inspect_network.return_value = {
+        "Containers": {"abc123": {"Name": "addon_1"}}
+    }
+    network.network.connect.side_effect = [APIError("exists"), None]
+
+    network.attach_container(container)
+
+    assert docker_client.api.inspect_network.call_count == 2
+    network.network.disconnect.assert_called_once_with("addon_1", force=True)
+    assert network.network.connect.call_count == 3
+
+
+def test_container_ids():
+    """Test container ids are indexed from network information."""
+    docker_client = MagicMock()
+    docker_client.networks.get.return_value.attrs = {
+        "Containers": {"abc123": {"Name": "hassio_supervisor"}}
+    }
+    network = DockerNetwork(docker_client)
+
+    assert network.container_ids == frozenset({"abc123"})
+
+
+def test_detach_default_bridge_cached():
+    """Test default bridge network is looked up once."""
+    docker_client = MagicMock()
+    network = DockerNetwork(docker_client)
+    docker_client.networks.get.reset_mock()
+
+    network.detach_default_bridge(MagicMock())
+    network.detach_default_bridge(MagicMock())
+
+    docker_client.networks.get.assert_called_once_with("bridge")
+    assert docker_client.networks.get.return_value.disconnect.call_count == 2
+
+
+def test_detach_default_bridge_stale():
+    """Test default bridge is looked up again when the cached one is gone."""
+    docker_client = MagicMock()
+    network = DockerNetwork(docker_client)
+    stale_bridge, bridge = MagicMock(), MagicMock()
+    stale_bridge.disconnect.side_effect = NotFound("gone")
+    docker_client.networks.get.reset_mock()
+    docker_client.networks.get.side_effect = [stale_bridge, bridge]
+    container = MagicMock()
+
+    network.detach_default_bridge(container)
+
+    assert docker_client.networks.get.call_count == 2
+    bridge.disconnect.assert_called_once_with(container)
+
+    network.detach_default_bridge(container)
+
+    assert docker_client.networks.get.call_count == 2
+    assert bridge.disconnect.call_count == 2
+
+
+def test_detach_default_bridge_not_found():
+    """Test detach returns silently if the fresh lookup is not found either."""
+    docker_client = MagicMock()
+    network = DockerNetwork(docker_client)
+    docker_client.networks.get.reset_mock()
+    docker_client.networks.get.return_value.disconnect.side_effect = NotFound("gone")
+
+    network.detach_default_bridge(MagicMock())
+
+    assert docker_client.networks.get.call_count == 2
+    assert docker_client.networks.get.return_value.disconnect.call_count == 2
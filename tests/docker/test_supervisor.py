@@ -0,0 +1,41 @@
+"""Test Supervisor docker object."""
+from unittest.mock import MagicMock
+
+from awesomeversion import AwesomeVersion
+from docker.errors import DockerException
+import pytest
+
+from supervisor.coresys import CoreSys
+from supervisor.exceptions import DockerError
+
+
+async def test_retag_uses_attached_image(coresys: CoreSys):
+    """Test retag uses image id from attach and falls back after failure."""
+    container = MagicMock()
+    container.attrs = {
+        "Image": "sha256:abc123",
+        "Config": {
+            "Image": "ghcr.io/home-assistant/amd64-hassio-supervisor:2023.1.0",
+            "Labels": {"io.hass.version": "2023.1.0"},
+        },
+    }
+    coresys.docker.containers.get.return_value = container
+    await coresys.supervisor.instance.attach(AwesomeVersion("2023.1.0"))
+
+    coresys.docker.containers.get.reset_mock()
+    coresys.docker.images.get.reset_mock()
+    await coresys.supervisor.instance.retag()
+
+    coresys.docker.images.get.assert_called_once_with("sha256:abc123")
+    coresys.docker.containers.get.assert_not_called()
+
+    coresys.docker.images.get.side_effect = DockerException()
+    with pytest.raises(DockerError):
+        await coresys.supervisor.instance.retag()
+
+    coresys.docker.images.get.side_effect = None
+    await coresys.supervisor.instance.retag()
+    coresys.docker.containers.get.assert_called_once_with("hassio_supervisor")
+    container.image.tag.assert_any_call(
+        "ghcr.io/home-assistant/amd64-hassio-supervisor", tag="latest"
+    )
@@ -1,5 +1,6 @@
 """Test auth object."""
 import asyncio
+from time import monotonic
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -84,3 +85,81 @@ async def test_auth_request_with_backend_cache_update(
     assert mock_auth_backend.called
     coresys.auth._dismatch_cache("username", "password")
     assert not await coresys.auth.check_login(addon, "username", "password")
+
+
+@pytest.mark.asyncio
+async def test_auth_request_without_backend_cache_mismatch(
+    coresys, mock_auth_backend, mock_api_state
+):
+    """Make simple auth without request and a wrong cached password."""
+
+    addon = MagicMock()
+    mock_api_state.return_value = False
+
+    coresys.auth._update_cache("username", "password")
+
+    assert not await coresys.auth.check_login(addon, "username", "passwort")
+    assert not mock_auth_backend.called
+
+
+@pytest.mark.asyncio
+async def test_auth_request_with_backend_recently_validated(
+    coresys, mock_auth_backend, mock_api_state
+):
+    """Make auth request with credentials recently confirmed by backend."""
+
+    addon = MagicMock()
+    mock_auth_backend.return_value = True
+    mock_api_state.return_value = True
+
+    coresys.auth._update_cache("username", "password")
+    coresys.auth._validated["username"] = monotonic() + 60
+
+    assert await coresys.auth.check_login(addon, "username", "password")
+    await asyncio.sleep(0)
+    assert not mock_auth_backend.called
+
+    coresys.auth.reset_data()
+
+    assert await coresys.auth.check_login(addon, "username", "password")
+    assert mock_auth_backend.called
+
+
+async def test_list_users_cached(coresys, ha_ws_client: AsyncMock):
+    """Test list users is cached for a short time."""
+    ha_ws_client.async_send_command.return_value = [{"username": "test"}]
+
+    assert await coresys.auth.list_users() == [{"username": "test"}]
+    assert await coresys.auth.list_users() == [{"username": "test"}]
+    ha_ws_client.async_send_command.assert_called_once()
+
+    coresys.auth.reset_data()
+    await coresys.auth.list_users()
+    assert ha_ws_client.async_send_command.call_count == 2
+
+
+async def test_auth_request_with_backend_concurrent(
+    coresys, mock_auth_backend, mock_api_state
+):
+    """Make identical concurrent auth requests share one backend request."""
+
+    addon = MagicMock()
+    mock_api_state.return_value = True
+    login_done = asyncio.Event()
+
+    async def mock_login(*_):
+        await login_done.wait()
+        return True
+
+    mock_auth_backend.side_effect = mock_login
+
+    logins = asyncio.gather(
+        coresys.auth.check_login(addon, "username", "password"),
+        coresys.auth.check_login(addon, "username", "password"),
+    )
+    await asyncio.sleep(0)
+    login_done.set()
+
+    assert await logins == [True, True]
+    mock_auth_backend.assert_called_once()
+    assert not coresys.auth._pending